@@ -0,0 +1,120 @@
+"""Benchmark Markdown report generation with and without `--jobs`.
+
+Usage: python scripts/bench_render.py [--repos 500] [--items 40] [--jobs 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from ghreport.config import ArgsCLI, Config
+from ghreport.generator import GHReportGenerator
+
+
+def _synthetic_results(repos: list[str], items: int) -> pd.DataFrame:
+    rows = []
+    for repo in repos:
+        for i in range(items):
+            kind = 'pr' if i % 2 else 'issue'
+            rows.append(
+                {
+                    'id': f'{repo}-{i}',
+                    'org_repo': repo,
+                    'repo_name': repo.split('/')[1],
+                    'type': kind,
+                    'number': i,
+                    'title': f'Item {i} | {repo}',
+                    'author_or_assignees': 'user',
+                    'created_at': '2025-01-01T00:00:00Z',
+                    'closed_at': '2025-01-02T00:00:00Z',
+                    'merged_at': (
+                        '2025-01-02T00:00:00Z' if kind == 'pr' else None
+                    ),
+                    'updated_at': '2025-01-02T00:00:00Z',
+                    'last_edit_at': None,
+                    'labels': 'bug, enhancement',
+                    'labels_raw': 'bug, enhancement',
+                    'state': 'MERGED' if kind == 'pr' else 'CLOSED',
+                    'url': f'https://github.com/{repo}/issues/{i}',
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repos', type=int, default=500)
+    parser.add_argument('--items', type=int, default=40)
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    opts = parser.parse_args()
+
+    repos = [f'org/repo-{i}' for i in range(opts.repos)]
+    results = _synthetic_results(repos, opts.items)
+    print(f'cpus={os.cpu_count()} repos={opts.repos} items={opts.items}')
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        parallel = _generator(repos, output_dir, opts.jobs)
+        workers = parallel.jobs
+        if workers < opts.jobs:
+            print(
+                f'warning: --jobs {opts.jobs} is capped at {workers} '
+                'worker(s) by the CPU count',
+                file=sys.stderr,
+            )
+
+        generators = [_generator(repos, output_dir, 1)]
+        if workers > 1:
+            generators.append(parallel)
+
+        timings: list[tuple[float, float]] = []
+        for generator in generators:
+            try:
+                # the first run includes the worker pool start-up, the
+                # second one reuses it, as watch mode does
+                cold = _timed(generator, results)
+                warm = _timed(generator, results)
+            finally:
+                generator.close()
+            timings.append((cold, warm))
+            print(
+                f'workers={generator.jobs:<3} '
+                f'cold={cold:.2f}s warm={warm:.2f}s'
+            )
+
+    if workers > 1:
+        serial = timings[0][1]
+        cold, warm = timings[1]
+        print(f'speedup: cold={serial / cold:.2f}x warm={serial / warm:.2f}x')
+    else:
+        print('no speedup measured: only one worker is available')
+
+
+def _generator(
+    repos: list[str], output_dir: str, jobs: int
+) -> GHReportGenerator:
+    config = Config(
+        name='bench',
+        repos=repos,
+        authors=[{'user': 'User'}],
+        output_dir=output_dir,
+        args=ArgsCLI(
+            start_date='2025-01-01', end_date='2025-01-31', jobs=jobs
+        ),
+    )
+    return GHReportGenerator(config)
+
+
+def _timed(generator: GHReportGenerator, results: pd.DataFrame) -> float:
+    start = time.perf_counter()
+    generator.generate(results, ['md'])
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    main()
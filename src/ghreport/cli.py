@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 from pathlib import Path
+from typing import List
 
+import click
 import typer
 
 from public import public
 
 from ghreport.config import ArgsCLI
+from ghreport.generator import GHReportGenerator
 from ghreport.report import GHReport
 
 __all__ = ['app', 'main']
@@ -40,7 +43,8 @@ app = typer.Typer(
 
 @public
 @app.callback(invoke_without_command=True)
-def main(
+def main(  # noqa: PLR0913, PLR0917 (typer maps each option to a parameter)
+    ctx: typer.Context,
     start_date: str = typer.Option(
         start_def.strftime('%Y-%m-%d'),
         '--start-date',
@@ -59,6 +63,23 @@ def main(
         '--config-file',
         help='Path to config file; defaults to ./.ghreport.yaml',
     ),
+    resume: bool = typer.Option(
+        False,
+        '--resume',
+        help='Resume interrupted searches from their last checkpoint.',
+    ),
+    formats: List[str] = typer.Option(
+        ['md'],
+        '--format',
+        click_type=click.Choice(GHReportGenerator.formats),
+        help='Output format; repeat to write several.',
+    ),
+    jobs: int = typer.Option(
+        1,
+        '--jobs',
+        min=1,
+        help='Number of processes used to render the report sections.',
+    ),
 ) -> None:
     """Run the report generation with the provided options."""
     args = ArgsCLI(
@@ -66,5 +87,25 @@ def main(
         end_date=end_date,
         gh_token=gh_token,
         config_file=str(config_file),
+        resume=resume,
+        formats=formats,
+        jobs=jobs,
     )
-    GHReport(args).run()
+    ctx.obj = args
+    if ctx.invoked_subcommand is None:
+        GHReport(args).run()
+
+
+@app.command()
+def watch(
+    ctx: typer.Context,
+    interval: float = typer.Option(
+        900,
+        '--interval',
+        min=1,
+        help='Seconds between polls for updated issues and PRs.',
+    ),
+) -> None:
+    """Stay resident and regenerate the report when GitHub data changes."""
+    args: ArgsCLI = ctx.obj
+    GHReport(args).watch(interval)
@@ -8,6 +8,9 @@ class ArgsCLI:
     end_date: str = ''
     gh_token: str = ''
     config_file: str = ''
+    resume: bool = False
+    formats: List[str] = field(default_factory=lambda: ['md'])
+    jobs: int = 1
 
 
 @dataclass
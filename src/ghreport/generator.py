@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import html
+import importlib.util
 import logging
+import multiprocessing
+import os
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Callable, Sequence, cast
 
 import pandas as pd
 
@@ -12,9 +19,18 @@ from ghreport.config import Config
 
 __all__ = ['GHReportGenerator']
 
+# rendering fewer sections than this in worker processes never pays off
+MIN_PARALLEL_SECTIONS = 2
+
+# sections per worker batch are sized so each worker gets about this many
+CHUNKS_PER_JOB = 4
+
 
 class GHReportGenerator:
-    """Generate a Markdown report summarising GitHub issues and PRs.
+    """Generate reports summarising GitHub issues and PRs.
+
+    Markdown and HTML reports are rendered from templates, grouped by
+    repository; CSV, JSON, and Parquet exports contain the flat table.
 
     Parameters
     ----------
@@ -30,10 +46,47 @@ class GHReportGenerator:
         'last_edit_at',
     )
 
+    formats: tuple[str, ...] = ('md', 'html', 'csv', 'json', 'parquet')
+
     def __init__(self, config: Config) -> None:
         self.config = config
         self._root = Path(__file__).resolve().parent
         self.logger = logging.getLogger(__name__)
+        self._writers: dict[str, Callable[[pd.DataFrame], None]] = {
+            'md': self._write_markdown,
+            'html': self._write_html,
+            'csv': self._write_csv,
+            'json': self._write_json,
+            'parquet': self._write_parquet,
+        }
+        self._pool: ProcessPoolExecutor | None = None
+
+    def close(self) -> None:
+        """Shut down the worker processes used to render the sections."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # created once and shared by every render (md, html, and each
+        # regeneration in watch mode), so `--jobs` caps the worker count and
+        # the start-up cost is paid only once; spawn keeps the event loop and
+        # open connections of the parent out of the workers
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return self._pool
+
+    @property
+    def jobs(self) -> int:
+        """Worker processes used for rendering.
+
+        This is `--jobs` capped at the CPU count, since more workers than
+        CPUs only add start-up and transfer overhead.
+        """
+        return max(1, min(self.config.args.jobs, os.cpu_count() or 1))
 
     def get_output_filepath_from_args(self, extension: str) -> Path:
         args = self.config.args
@@ -44,27 +97,57 @@ class GHReportGenerator:
         )
         return Path(self.config.output_dir) / fname
 
-    def generate(self, results: pd.DataFrame) -> None:
-        tmpl = self._load_template()
+    def generate(
+        self, results: pd.DataFrame, formats: Sequence[str] | None = None
+    ) -> None:
+        """Write the report in every requested format.
+
+        Parameters
+        ----------
+        results
+            Data returned by `GHReportReader.get_data`.
+        formats
+            Output formats; defaults to the ones given in the CLI arguments.
+            Every format is produced from the same prepared data.
+        """
+        formats = self.check_formats(formats or self.config.args.formats)
         prepared = self._prepare_dataframe(results)
-        projects = self._build_tables(prepared)
-        self._write_markdown(tmpl, projects)
+        for fmt in formats:
+            self._writers[fmt](prepared)
+
+    def check_formats(self, formats: Sequence[str]) -> list[str]:
+        """Validate the requested output formats before any data is fetched.
 
-    def _load_template(self) -> Template:
-        path = self._root / 'templates' / 'template.md'
+        Returns the formats without duplicates, defaulting to Markdown.
+        """
+        formats = list(dict.fromkeys(formats or ['md']))
+        unknown = [f for f in formats if f not in self._writers]
+        if unknown:
+            raise ValueError(
+                f'Unsupported output format(s): {", ".join(unknown)}; '
+                f'choose from {", ".join(self.formats)}'
+            )
+        if 'parquet' in formats and not any(
+            importlib.util.find_spec(engine)
+            for engine in ('pyarrow', 'fastparquet')
+        ):
+            raise ImportError(
+                'The parquet format requires `pyarrow` or `fastparquet`'
+            )
+        return formats
+
+    def _load_template(self, name: str = 'template.md') -> Template:
+        path = self._root / 'templates' / name
         with path.open(encoding='utf-8') as fh:
             return Template(fh.read())
 
-    def _write_markdown(
+    def _render_template(
         self, tmpl: Template, projects: list[dict[str, str]]
-    ) -> None:
-        path = self.get_output_filepath_from_args('md')
-        path.parent.mkdir(parents=True, exist_ok=True)
-
+    ) -> str:
         args = self.config.args
         authors_display = [next(iter(a), '') for a in self.config.authors]
 
-        content = tmpl.render(
+        return tmpl.render(
             report_title=self.config.title or 'Report',
             orgs_repos=', '.join(self.config.repos),
             authors=', '.join(authors_display),
@@ -72,9 +155,47 @@ class GHReportGenerator:
             end_date=args.end_date,
             projects=projects,
         )
-        path.write_text(content, encoding='utf-8')
+
+    def _output_path(self, extension: str) -> Path:
+        path = self.get_output_filepath_from_args(extension)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _write_markdown(self, df: pd.DataFrame) -> None:
+        tmpl = self._load_template('template.md')
+        projects = self._build_tables(
+            self._markdown_frame(df), _markdown_table
+        )
+        path = self._output_path('md')
+        path.write_text(
+            self._render_template(tmpl, projects), encoding='utf-8'
+        )
         self.logger.info('Markdown report saved to %s', path)
 
+    def _write_html(self, df: pd.DataFrame) -> None:
+        tmpl = self._load_template('template.html')
+        projects = self._build_tables(self._html_frame(df), _html_table)
+        path = self._output_path('html')
+        path.write_text(
+            self._render_template(tmpl, projects), encoding='utf-8'
+        )
+        self.logger.info('HTML report saved to %s', path)
+
+    def _write_csv(self, df: pd.DataFrame) -> None:
+        path = self._output_path('csv')
+        self._columnar_frame(df).to_csv(path, index=False)
+        self.logger.info('CSV report saved to %s', path)
+
+    def _write_json(self, df: pd.DataFrame) -> None:
+        path = self._output_path('json')
+        self._columnar_frame(df).to_json(path, orient='records', indent=2)
+        self.logger.info('JSON report saved to %s', path)
+
+    def _write_parquet(self, df: pd.DataFrame) -> None:
+        path = self._output_path('parquet')
+        self._columnar_frame(df).to_parquet(path, index=False)
+        self.logger.info('Parquet report saved to %s', path)
+
     def _prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
 
@@ -85,11 +206,6 @@ class GHReportGenerator:
                 lambda col: col.astype(str).str.slice(0, 10)
             )
 
-        # turn issue/PR number into an HTML link
-        df['number'] = (
-            "<a href='" + df['url'] + "'>" + df['number'].astype(str) + '</a>'
-        )
-
         # merge / state normalisation for PRs
         is_pr = df['type'] == 'pr'
         merged_mask = df['labels_raw'].str.contains('Merged', na=False)
@@ -118,6 +234,54 @@ class GHReportGenerator:
 
         return df
 
+    @staticmethod
+    def _number_links(df: pd.DataFrame) -> pd.Series:
+        return (
+            "<a href='" + df['url'] + "'>" + df['number'].astype(str) + '</a>'
+        )
+
+    def _markdown_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        # turn issue/PR number into an HTML link
+        df['number'] = self._number_links(df)
+        # escape pipes, which would otherwise break the table cells
+        for col in ('title', 'labels'):
+            df[col] = df[col].str.replace('|', '\\|', regex=False)
+        return df
+
+    def _html_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        # tables are rendered with `escape=False` so the number links stay
+        # intact; escape every text value (url included) before adding them
+        df = df.copy()
+        for col in df.columns:
+            df[col] = df[col].map(
+                lambda v: html.escape(v) if isinstance(v, str) else v
+            )
+        df['number'] = self._number_links(df)
+        return df
+
+    def _columnar_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        cols = [
+            'org_repo',
+            'repo_name',
+            'type',
+            'number',
+            'url',
+            'title',
+            'author',
+            'assignees',
+            'labels',
+            'state',
+            *self.date_cols,
+        ]
+        df = df[[c for c in cols if c in df.columns]].copy()
+        # date truncation stringifies missing values; restore them as nulls
+        existing_dates = [c for c in self.date_cols if c in df.columns]
+        df[existing_dates] = df[existing_dates].replace(
+            {'None': None, 'nan': None}
+        )
+        return df.reset_index(drop=True)
+
     def _output_columns(self) -> list[str]:
         base = [
             'repo_name',
@@ -150,30 +314,65 @@ class GHReportGenerator:
         }
         return [c for c in cols if c not in issues_only]
 
-    def _build_tables(self, df: pd.DataFrame) -> list[dict[str, str]]:
+    def _build_tables(
+        self,
+        df: pd.DataFrame,
+        render: Callable[[pd.DataFrame], str],
+    ) -> list[dict[str, str]]:
         cols = self._output_columns()
         issues_cols = self._issues_columns(cols)
         prs_cols = self._prs_columns(cols)
 
-        projects: list[dict[str, str]] = []
-        for repo in self.config.repos:
-            subset = df[df.org_repo == repo]
-            prs_md_df = subset[subset.type == 'pr'][prs_cols].reset_index(
-                drop=True
-            )
-            issues_md_df = subset[subset.type == 'issue'][
-                issues_cols
-            ].reset_index(drop=True)
-
-            projects.append(
-                {
-                    'name': repo.split('/')[1],
-                    'pr_results': prs_md_df.to_markdown(index=False)
-                    if not prs_md_df.empty
-                    else 'None',
-                    'issue_results': issues_md_df.to_markdown(index=False)
-                    if not issues_md_df.empty
-                    else 'None',
-                }
+        # the parent only groups by repo, in a single pass over the columns
+        # that are rendered; the split by type, the column selection and the
+        # rendering itself happen per section, in the workers when enabled
+        needed = ['type', *dict.fromkeys([*prs_cols, *issues_cols])]
+        groups = dict(iter(df[needed].groupby(df['org_repo'], sort=False)))
+        empty = df[needed].iloc[0:0]
+        names = [repo.split('/')[1] for repo in self.config.repos]
+        subsets = [groups.get(repo, empty) for repo in self.config.repos]
+
+        jobs = self.jobs
+        if jobs <= 1 or len(names) < MIN_PARALLEL_SECTIONS:
+            return [
+                _render_section(render, prs_cols, issues_cols, name, subset)
+                for name, subset in zip(names, subsets)
+            ]
+
+        # results come back in submission order, i.e. `config.repos`
+        return list(
+            self._get_pool().map(
+                _render_section,
+                repeat(render),
+                repeat(prs_cols),
+                repeat(issues_cols),
+                names,
+                subsets,
+                chunksize=max(1, len(names) // (jobs * CHUNKS_PER_JOB)),
             )
-        return projects
+        )
+
+
+def _markdown_table(df: pd.DataFrame) -> str:
+    return cast(str, df.to_markdown(index=False))
+
+
+def _html_table(df: pd.DataFrame) -> str:
+    return cast(str, df.to_html(index=False, escape=False))
+
+
+def _render_section(
+    render: Callable[[pd.DataFrame], str],
+    prs_cols: list[str],
+    issues_cols: list[str],
+    name: str,
+    subset: pd.DataFrame,
+) -> dict[str, str]:
+    kind = subset['type']
+    prs = subset.loc[kind == 'pr', prs_cols].reset_index(drop=True)
+    issues = subset.loc[kind == 'issue', issues_cols].reset_index(drop=True)
+    return {
+        'name': name,
+        'pr_results': render(prs) if not prs.empty else 'None',
+        'issue_results': render(issues) if not issues.empty else 'None',
+    }
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
+import json
 import logging
 import re
+import shutil
 
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Any, cast
 
@@ -30,6 +34,76 @@ class _GitHubClient:
         )
 
 
+class _SearchJournal:
+    """Checkpoint each search's pages and cursors to a local directory.
+
+    Every search gets its own append-only JSONL file, keyed by a hash of
+    the rendered search variables, with one line per fetched page holding
+    the page edges and its `endCursor`. An interrupted run rebuilds the
+    accumulated state from these lines and continues from the last page
+    that was fetched successfully.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @staticmethod
+    def key(variables: dict[str, str]) -> str:
+        raw = json.dumps(variables, sort_keys=True)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()  # nosec B324
+
+    def _file(self, key: str) -> Path:
+        return self.path / f'{key}.jsonl'
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        path = self._file(key)
+        if not path.exists():
+            return None
+
+        state: dict[str, Any] = {'edges': [], 'after': None, 'complete': False}
+        valid = 0
+        with path.open('rb') as fh:
+            for line in fh:
+                try:
+                    page = json.loads(line)
+                except json.JSONDecodeError:
+                    # a crash while appending leaves a partial last line
+                    logger.warning('Truncating corrupted checkpoint %s', path)
+                    with path.open('r+b') as out:
+                        out.truncate(valid)
+                    break
+                valid += len(line)
+                state['edges'].extend(page['edges'])
+                state['after'] = page['after']
+                state['complete'] = page['complete']
+        return state if valid else None
+
+    def reset(self, key: str) -> None:
+        self._file(key).unlink(missing_ok=True)
+
+    def append(
+        self,
+        key: str,
+        edges: list[dict[str, Any]],
+        after: str | None,
+        complete: bool,
+    ) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(
+            {'edges': edges, 'after': after, 'complete': complete}
+        )
+        with self._file(key).open('a', encoding='utf-8') as fh:
+            fh.write(line + '\n')
+
+    def clear(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+        # drop the journal root too, unless other runs still use it
+        try:
+            self.path.parent.rmdir()
+        except OSError:
+            pass
+
+
 @dataclasses.dataclass
 class GitHubSearchFilters:
     org_repos: list[str]
@@ -42,6 +116,74 @@ class GitHubSearchFilters:
     closed_at: bool = False
     updated_at: bool = False
     custom_filter: dict[str, str] = dataclasses.field(default_factory=dict)
+    # applied to the results, not sent to GitHub
+    labels_contain: str = ''
+
+    def matches(self, df: pd.DataFrame) -> pd.Series:
+        """Evaluate the filters locally on rows returned by a search.
+
+        Repositories and authors are not checked, since the rows are
+        expected to come from a search already restricted to them.
+        """
+        mask = df['type'] == self.search_type
+        if self.status:
+            states = {s.upper() for s in self.status}
+            if 'CLOSED' in states:
+                # GitHub's `is:closed` also matches merged pull requests
+                states.add('MERGED')
+            mask &= df['state'].isin(states)
+
+        period = f'{self.start_date}..{self.end_date}'
+        for flag, qualifier in (
+            (self.merged_at, 'merged'),
+            (self.closed_at, 'closed'),
+            (self.updated_at, 'updated'),
+        ):
+            if flag:
+                mask &= _match_date(df[f'{qualifier}_at'], period)
+        for qualifier, value in self.custom_filter.items():
+            if qualifier not in _DATE_QUALIFIERS:
+                raise ValueError(
+                    f'Filter `{qualifier}:` cannot be evaluated locally'
+                )
+            mask &= _match_date(df[f'{qualifier}_at'], value)
+
+        if self.labels_contain:
+            mask &= df['labels_raw'].str.contains(
+                self.labels_contain, na=False
+            )
+        return mask
+
+
+_DATE_QUALIFIERS = ('created', 'updated', 'closed', 'merged')
+_DATE_RANGE_RE = re.compile(r'^(?P<op><=|>=|<|>)?(?P<value>.+)$')
+
+
+def _match_date(col: pd.Series, expr: str) -> pd.Series:
+    """Match ISO timestamps against a GitHub date qualifier value.
+
+    Supports `a..b` ranges and `<=`, `>=`, `<`, `>` comparisons, at day
+    precision.
+    """
+    day = col.fillna('').astype(str).str.slice(0, 10)
+    present = day != ''
+    if '..' in expr:
+        low, high = (v[:10] for v in expr.split('..', 1))
+        return present & (day >= low) & (day <= high)
+
+    m = _DATE_RANGE_RE.match(expr)
+    if not m:
+        raise ValueError(f'Invalid date qualifier value: {expr!r}')
+    op, value = m.group('op'), m.group('value')[:10]
+    if op == '<=':
+        return present & (day <= value)
+    if op == '>=':
+        return present & (day >= value)
+    if op == '<':
+        return present & (day < value)
+    if op == '>':
+        return present & (day > value)
+    return day == value
 
 
 class _GitHubSearch:
@@ -51,9 +193,36 @@ class _GitHubSearch:
     _selector_re = re.compile(r'#\s*\[(?P<left>[^\]=]+)==(?P<right>[^\]]+)\]')
     _page_limit: int = 100
 
-    def __init__(self, token: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        journal: _SearchJournal | None = None,
+        resume: bool = False,
+    ) -> None:
         self.client = _GitHubClient(token)
+        self.journal = journal
+        self.resume = resume
         self._template = Template(self._tmpl_path.read_text(encoding='utf-8'))
+        self._stack: AsyncExitStack | None = None
+        self._session: Any = None
+
+    async def connect(self) -> None:
+        """Open a session that is reused by every query until `close`."""
+        if self._session is not None:
+            return
+        self._stack = AsyncExitStack()
+        self._session = await self._stack.enter_async_context(
+            Client(
+                transport=self.client.transport,
+                fetch_schema_from_transport=False,
+            )
+        )
+
+    async def close(self) -> None:
+        if self._stack is not None:
+            await self._stack.aclose()
+        self._stack = None
+        self._session = None
 
     @staticmethod
     def _conditional_include(line: str, ctx: dict[str, str]) -> bool:
@@ -74,6 +243,13 @@ class _GitHubSearch:
     async def _fetch(
         self, query_str: str, vars_: dict[str, Any]
     ) -> dict[str, Any]:
+        if self._session is not None:
+            return cast(
+                dict[str, Any],
+                await self._session.execute(
+                    gql(query_str), variable_values=vars_
+                ),
+            )
         async with Client(
             transport=self.client.transport, fetch_schema_from_transport=False
         ) as session:
@@ -84,10 +260,27 @@ class _GitHubSearch:
             )
 
     async def _paginate(
-        self, variables: dict[str, str]
+        self, variables: dict[str, str], checkpoint: bool = True
     ) -> list[dict[str, Any]]:
         after: str | None = None
         edges: list[dict[str, Any]] = []
+
+        journal = self.journal if checkpoint else None
+        key = _SearchJournal.key(variables)
+        if journal and not self.resume:
+            journal.reset(key)
+        elif journal:
+            saved = journal.load(key)
+            if saved:
+                edges = saved.get('edges', [])
+                after = saved.get('after')
+                if saved.get('complete'):
+                    logger.info('Skipping completed search %s', key)
+                    return edges
+                logger.info(
+                    'Resuming search %s after %d edges', key, len(edges)
+                )
+
         while True:
             page_vars = {
                 **variables,
@@ -99,15 +292,21 @@ class _GitHubSearch:
             batch = result.get('search', {}).get('edges', [])
             edges.extend(batch)
             info = result.get('search', {}).get('pageInfo', {})
-            if not info.get('hasNextPage'):
+            has_next = bool(info.get('hasNextPage'))
+            if has_next:
+                after = info.get('endCursor')
+            if journal:
+                journal.append(key, batch, after, complete=not has_next)
+            if not has_next:
                 break
-            after = info.get('endCursor')
         return edges
 
     def _extract_period(self, fld: str, flt: GitHubSearchFilters) -> str:
         return f'{fld}:{flt.start_date}..{flt.end_date}'
 
-    async def search(self, flt: GitHubSearchFilters) -> pd.DataFrame:
+    async def search(
+        self, flt: GitHubSearchFilters, checkpoint: bool = True
+    ) -> pd.DataFrame:
         if flt.search_type not in {'pr', 'issue'}:
             raise ValueError("search_type must be 'pr' or 'issue'")
 
@@ -142,9 +341,11 @@ class _GitHubSearch:
             ),
         }
 
-        edges = await self._paginate(vars_)
+        edges = await self._paginate(vars_, checkpoint=checkpoint)
         df = self._edges_to_df(edges)
         df['type'] = flt.search_type
+        if flt.labels_contain:
+            df = df[df.labels_raw.str.contains(flt.labels_contain)]
         return df
 
     @staticmethod
@@ -165,17 +366,14 @@ class _GitHubSearch:
                     a['node']['login'] for a in node['assignees']['edges']
                 )
 
-            labels = [
-                lbl['name'].replace('|', '\\|')
-                for lbl in node['labels']['nodes']
-            ]
+            labels = [lbl['name'] for lbl in node['labels']['nodes']]
             rows.append(
                 {
                     'id': node['id'],
                     'org_repo': node['repository']['nameWithOwner'],
                     'repo_name': node['repository']['name'],
                     'number': node['number'],
-                    'title': node['title'].replace('|', '\\|'),
+                    'title': node['title'],
                     'author_or_assignees': author_or_assignees,
                     'created_at': node['createdAt'],
                     'closed_at': node['closedAt'],
@@ -213,6 +411,33 @@ class _GitHubSearch:
 class GHReportReader:
     def __init__(self, config: Config) -> None:
         self.config = config
+        self._searcher: _GitHubSearch | None = None
+
+    async def connect(self) -> None:
+        """Keep one GitHub session open across subsequent queries."""
+        await self._get_searcher().connect()
+
+    async def close(self) -> None:
+        if self._searcher is not None:
+            await self._searcher.close()
+
+    def _get_searcher(self) -> _GitHubSearch:
+        if self._searcher is None:
+            self._searcher = _GitHubSearch(
+                self.config.gh_token,
+                journal=self._journal(),
+                resume=self.config.args.resume,
+            )
+        return self._searcher
+
+    def _base_filters(self) -> dict[str, Any]:
+        args = self.config.args
+        return {
+            'org_repos': self.config.repos,
+            'authors': [next(iter(a), '') for a in self.config.authors],
+            'start_date': args.start_date,
+            'end_date': args.end_date,
+        }
 
     async def get_data(self) -> pd.DataFrame:
         args: ArgsCLI = self.config.args
@@ -225,57 +450,122 @@ class GHReportReader:
         if not self.config.authors:
             raise ValueError('At least one author must be specified')
 
-        base = {
-            'org_repos': self.config.repos,
-            'authors': [next(iter(a), '') for a in self.config.authors],
-            'start_date': args.start_date,
-            'end_date': args.end_date,
-        }
-        searcher = _GitHubSearch(self.config.gh_token)
-        dfs: list[pd.DataFrame] = []
+        searcher = self._get_searcher()
+        dfs = [await searcher.search(flt) for flt in self._report_filters()]
 
-        dfs.append(
-            await searcher.search(
-                GitHubSearchFilters(
-                    **base,  # type: ignore[arg-type]
-                    search_type='pr',
-                    status=['OPEN'],
-                    custom_filter={
-                        'created': f'<={args.end_date}',
-                        'updated': f'>={args.start_date}',
-                    },
-                )
-            )
-        )
-        dfs.append(
+        # every search finished, so the checkpoints are no longer needed
+        if searcher.journal:
+            searcher.journal.clear()
+        return pd.concat(dfs, ignore_index=True)
+
+    async def get_updates(self, since: str) -> pd.DataFrame:
+        """Fetch the PRs and issues updated at or after `since`.
+
+        Parameters
+        ----------
+        since
+            ISO 8601 timestamp used in the `updated:>=` search qualifier.
+        """
+        base = self._base_filters()
+        searcher = self._get_searcher()
+        dfs = [
             await searcher.search(
                 GitHubSearchFilters(
-                    **base,  # type: ignore[arg-type]
-                    search_type='pr',
-                    status=['MERGED'],
-                    merged_at=True,
-                )
+                    **base,
+                    search_type=search_type,
+                    custom_filter={'updated': f'>={since}'},
+                ),
+                checkpoint=False,
             )
-        )
-        closed_prs = await searcher.search(
+            for search_type in ('pr', 'issue')
+        ]
+        return pd.concat(dfs, ignore_index=True)
+
+    def _report_filters(self) -> list[GitHubSearchFilters]:
+        """Return the searches that select the items of the report.
+
+        `get_data` sends them to GitHub, and `in_period` evaluates them
+        locally on updated items in watch mode.
+        """
+        args = self.config.args
+        base = self._base_filters()
+        return [
+            GitHubSearchFilters(
+                **base,
+                search_type='pr',
+                status=['OPEN'],
+                custom_filter={
+                    'created': f'<={args.end_date}',
+                    'updated': f'>={args.start_date}',
+                },
+            ),
+            GitHubSearchFilters(
+                **base,
+                search_type='pr',
+                status=['MERGED'],
+                merged_at=True,
+            ),
             GitHubSearchFilters(
-                **base,  # type: ignore[arg-type]
+                **base,
                 search_type='pr',
                 status=['CLOSED'],
                 closed_at=True,
-            )
-        )
-        dfs.append(closed_prs[closed_prs.labels_raw.str.contains('Merged')])
+                labels_contain='Merged',
+            ),
+            GitHubSearchFilters(
+                **base,
+                search_type='issue',
+                status=['CLOSED'],
+                closed_at=True,
+            ),
+        ]
 
-        dfs.append(
-            await searcher.search(
-                GitHubSearchFilters(
-                    **base,  # type: ignore[arg-type]
-                    search_type='issue',
-                    status=['CLOSED'],
-                    closed_at=True,
-                )
-            )
+    def in_period(self, df: pd.DataFrame) -> pd.Series:
+        """Return a mask of the rows `get_data` would have selected."""
+        mask = pd.Series(False, index=df.index)
+        for flt in self._report_filters():
+            mask |= flt.matches(df)
+        return mask
+
+    def merge_updates(
+        self, data: pd.DataFrame, updates: pd.DataFrame
+    ) -> tuple[pd.DataFrame, bool]:
+        """Upsert `updates` into `data` by `id`.
+
+        Updated items that no longer belong to the report period are
+        dropped, and items already held with the same `updated_at` are
+        ignored, so overlapping polls are harmless. The returned flag tells
+        whether `data` has changed.
+        """
+        known = set(zip(data['id'], data['updated_at']))
+        updates = updates[
+            [
+                (id_, updated) not in known
+                for id_, updated in zip(updates['id'], updates['updated_at'])
+            ]
+        ]
+        if updates.empty:
+            return data, False
+
+        matching = updates[self.in_period(updates)]
+        stale = data['id'].isin(updates['id'])
+        if matching.empty and not stale.any():
+            return data, False
+
+        # updated items keep their position, new items go at the end
+        position = {id_: pos for pos, id_ in enumerate(data['id'])}
+        merged = pd.concat([data[~stale], matching], ignore_index=True)
+        order = merged['id'].map(position).fillna(len(position))
+        merged = merged.iloc[order.argsort(kind='stable')]
+        return merged.reset_index(drop=True), True
+
+    def _journal(self) -> _SearchJournal:
+        args = self.config.args
+        name = (
+            f'{self.config.name}-'
+            f'{args.start_date.replace("-", "")}-'
+            f'{args.end_date.replace("-", "")}'
+        )
+        return _SearchJournal(
+            Path(self.config.output_dir) / '.ghreport-journal' / name
         )
-
-        return pd.concat(dfs, ignore_index=True)
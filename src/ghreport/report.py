@@ -2,20 +2,39 @@ from __future__ import annotations
 
 import asyncio
 import io
+import logging
 import os
 
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import cast
 
+import aiohttp
 import dotenv
 import yaml
 
+from gql.transport.exceptions import TransportError
+
 from ghreport.config import ArgsCLI, Config
 from ghreport.generator import GHReportGenerator
 from ghreport.reader import GHReportReader
 
 __all__ = ['GHReport']
 
+logger = logging.getLogger(__name__)
+
+# GitHub's search index is eventually consistent, so each poll also covers
+# this much time before the previous one to catch late-indexed items
+POLL_OVERLAP = timedelta(minutes=5)
+
+# errors after which a poll is retried on the next interval
+_POLL_ERRORS = (
+    aiohttp.ClientError,
+    TransportError,
+    asyncio.TimeoutError,
+    OSError,
+)
+
 
 class GHReport:
     """CLI entry-point coordinating data retrieval and report generation."""
@@ -28,6 +47,8 @@ class GHReport:
 
         self.reader = GHReportReader(self.config)
         self.generator = GHReportGenerator(self.config)
+        # fail before fetching anything if the report can't be written
+        self.generator.check_formats(self.config.args.formats)
 
     def _read_config(self) -> Config:
         raw = self.config_path.read_text()
@@ -67,4 +88,70 @@ class GHReport:
 
     async def run_async(self) -> None:
         data = await self.reader.get_data()
-        self.generator.generate(data)
+        try:
+            self.generator.generate(data)
+        finally:
+            self.generator.close()
+
+    def watch(self, interval: float, max_polls: int | None = None) -> None:
+        asyncio.run(self.watch_async(interval, max_polls))
+
+    async def watch_async(
+        self, interval: float, max_polls: int | None = None
+    ) -> None:
+        """Keep the report up to date by polling for updated items.
+
+        The first iteration performs a full fetch. Afterwards, every
+        `interval` seconds only the items updated since the previous poll
+        are requested over the same GitHub session, upserted into the
+        in-memory data by `id`, and the report is regenerated only when
+        something changed. Each poll starts `POLL_OVERLAP` before the
+        previous one; a poll that fails is logged and its window is retried
+        on the next interval.
+
+        Parameters
+        ----------
+        interval
+            Seconds to wait between polls.
+        max_polls
+            Stop after this many incremental polls; run forever if None.
+        """
+        await self.reader.connect()
+        try:
+            since = self._utcnow()
+            data = await self.reader.get_data()
+            self.generator.generate(data)
+
+            polls = 0
+            while max_polls is None or polls < max_polls:
+                await asyncio.sleep(interval)
+                polls += 1
+
+                poll_at = self._utcnow()
+                try:
+                    updates = await self.reader.get_updates(
+                        self._isoformat(since - POLL_OVERLAP)
+                    )
+                except _POLL_ERRORS as exc:
+                    logger.warning(
+                        'Poll failed, retrying on next interval: %r', exc
+                    )
+                    continue
+                since = poll_at
+
+                data, changed = self.reader.merge_updates(data, updates)
+                if changed:
+                    self.generator.generate(data)
+                else:
+                    logger.info('No changes since last poll.')
+        finally:
+            self.generator.close()
+            await self.reader.close()
+
+    @staticmethod
+    def _utcnow() -> datetime:
+        return datetime.now(timezone.utc).replace(microsecond=0)
+
+    @staticmethod
+    def _isoformat(moment: datetime) -> str:
+        return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -1,17 +1,316 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import os
+import re
+
 from pathlib import Path
 
+import pandas as pd
+import pytest
+
 from ghreport import GHReport
-from ghreport.config import ArgsCLI
+from ghreport.cli import app
+from ghreport.config import ArgsCLI, Config
+from ghreport.generator import GHReportGenerator
+from ghreport.reader import (
+    GHReportReader,
+    GitHubSearchFilters,
+    _GitHubSearch,
+    _SearchJournal,
+)
+from typer.testing import CliRunner
+
+START_DATE = '2023-07-01'
+END_DATE = '2023-07-31'
+IN_PERIOD = '2023-07-15T00:00:00Z'
+PAGE_COUNT = 3
+
+
+def _row(id_: str, **kwargs: object) -> dict[str, object]:
+    """Build a row shaped like the output of `GHReportReader.get_data`."""
+    repo = str(kwargs.pop('org_repo', 'org/repo'))
+    return {
+        'id': id_,
+        'org_repo': repo,
+        'repo_name': repo.split('/')[1],
+        'type': 'pr',
+        'number': 1,
+        'title': f'Item {id_}',
+        'author_or_assignees': 'user',
+        'created_at': '2023-06-20T00:00:00Z',
+        'closed_at': None,
+        'merged_at': None,
+        'updated_at': '2023-07-10T00:00:00Z',
+        'last_edit_at': None,
+        'labels': '',
+        'labels_raw': '',
+        'state': 'OPEN',
+        'url': f'https://github.com/{repo}/pull/1',
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> Config:
+    return Config(
+        name='test',
+        repos=['org/repo'],
+        authors=[{'user': 'User Name'}],
+        output_dir=str(tmp_path),
+        args=ArgsCLI(start_date=START_DATE, end_date=END_DATE),
+    )
 
 
 def test_ghreport():
     report = GHReport(
         ArgsCLI(
             **{
-                'start_date': '2023-07-01',
-                'end_date': '2023-07-31',
+                'start_date': START_DATE,
+                'end_date': END_DATE,
                 'config_file': str(Path(__file__).parent / '.ghreport.yaml'),
             }
         )
     )
     report.run()
+
+
+PAGES = [
+    {
+        'search': {
+            'edges': [{'node': {'id': str(i)}}],
+            'pageInfo': {
+                'hasNextPage': i < PAGE_COUNT - 1,
+                'endCursor': f'c{i}',
+            },
+        }
+    }
+    for i in range(PAGE_COUNT)
+]
+
+
+class _FakeSearch(_GitHubSearch):
+    """Serve `PAGES` by cursor, failing when `fail_after` is requested."""
+
+    def __init__(self, fail_after: str | None = None, **kwargs):
+        super().__init__('token', **kwargs)
+        self.fail_after = fail_after
+        self.cursors: list[str | None] = []
+
+    async def _fetch(self, query_str, vars_):
+        match = re.search(r'after: "(\w+)"', query_str)
+        after = match.group(1) if match else None
+        self.cursors.append(after)
+        if after is not None and after == self.fail_after:
+            raise ConnectionError('boom')
+        return PAGES[0 if after is None else int(after[1:]) + 1]
+
+
+def test_paginate_resume(tmp_path):
+    journal = _SearchJournal(tmp_path / 'journal')
+    variables = {'search_type': 'pr'}
+
+    flaky = _FakeSearch(fail_after='c1', journal=journal)
+    with pytest.raises(ConnectionError):
+        asyncio.run(flaky._paginate(variables))
+    assert flaky.cursors == [None, 'c0', 'c1']
+
+    resumed = _FakeSearch(journal=journal, resume=True)
+    edges = asyncio.run(resumed._paginate(variables))
+    assert [e['node']['id'] for e in edges] == ['0', '1', '2']
+    assert resumed.cursors == ['c1']
+
+    # completed searches are not fetched again
+    skipped = _FakeSearch(journal=journal, resume=True)
+    assert len(asyncio.run(skipped._paginate(variables))) == len(PAGES)
+    assert skipped.cursors == []
+
+    journal.clear()
+    assert not tmp_path.joinpath('journal').exists()
+
+
+def test_merge_updates(config):
+    reader = GHReportReader(config)
+    data = pd.DataFrame([_row('a'), _row('b'), _row('d')])
+
+    data, changed = reader.merge_updates(data, data.iloc[0:0])
+    assert not changed
+    # items seen again by an overlapping poll are not a change
+    data, changed = reader.merge_updates(data, data.copy())
+    assert not changed
+
+    merged = {'state': 'MERGED', 'merged_at': IN_PERIOD}
+    updates = pd.DataFrame(
+        [
+            _row('c', **merged, updated_at=IN_PERIOD),
+            _row('a', **merged, updated_at=IN_PERIOD),
+            _row(
+                'b', state='CLOSED', closed_at=IN_PERIOD, updated_at=IN_PERIOD
+            ),
+            _row('e', type='issue'),
+        ]
+    )
+    data, changed = reader.merge_updates(data, updates)
+    assert changed
+    # updated rows stay in place, rows leaving the period are dropped and
+    # new rows are appended
+    assert data['id'].tolist() == ['a', 'd', 'c']
+    assert data['state'].tolist() == ['MERGED', 'OPEN', 'MERGED']
+
+
+def test_in_period_uses_get_data_filters(config):
+    reader = GHReportReader(config)
+    config.gh_token = 'token'
+    sent: list[GitHubSearchFilters] = []
+
+    class RecordingSearch:
+        journal = None
+
+        async def search(self, flt):
+            sent.append(flt)
+            return pd.DataFrame([_row('x')])
+
+    reader._searcher = RecordingSearch()
+    asyncio.run(reader.get_data())
+
+    rows = pd.DataFrame(
+        [
+            _row('open'),
+            _row('open-old', updated_at='2023-06-30T00:00:00Z'),
+            _row('merged', state='MERGED', merged_at=IN_PERIOD),
+            _row('merged-late', state='MERGED', merged_at='2023-08-01'),
+            _row('closed', state='CLOSED', closed_at=IN_PERIOD),
+            _row(
+                'closed-merged',
+                state='CLOSED',
+                closed_at=IN_PERIOD,
+                labels_raw='Merged',
+            ),
+            _row('issue', type='issue', state='CLOSED', closed_at=IN_PERIOD),
+            _row('issue-open', type='issue'),
+        ]
+    )
+    expected = pd.Series(False, index=rows.index)
+    for flt in sent:
+        expected |= flt.matches(rows)
+
+    selected = rows[reader.in_period(rows)]['id'].tolist()
+    assert selected == rows[expected]['id'].tolist()
+    assert selected == ['open', 'merged', 'closed-merged', 'issue']
+
+
+def test_generate_formats(config, tmp_path):
+    results = pd.DataFrame(
+        [
+            _row(
+                'a',
+                title='Fix a | b <3',
+                state='MERGED',
+                merged_at=IN_PERIOD,
+            )
+        ]
+    )
+    config.authors = [{'user': 'Smith & Co'}]
+    GHReportGenerator(config).generate(results, ['md', 'html', 'csv', 'json'])
+
+    base = tmp_path / 'report-test-20230701-20230731'
+    markdown = base.with_suffix('.md').read_text()
+    assert 'Fix a \\| b <3' in markdown
+    assert "<a href='https://github.com/org/repo/pull/1'>1</a>" in markdown
+    page = base.with_suffix('.html').read_text()
+    assert 'Fix a | b &lt;3' in page
+    assert 'Smith &amp; Co' in page
+    assert "<a href='https://github.com/org/repo/pull/1'>1</a>" in page
+
+    records = json.loads(base.with_suffix('.json').read_text())
+    assert records[0]['number'] == 1
+    assert records[0]['title'] == 'Fix a | b <3'
+    assert records[0]['author'] == 'Smith & Co'
+    assert pd.read_csv(base.with_suffix('.csv'))['number'].tolist() == [1]
+
+
+def test_check_formats(config, monkeypatch):
+    generator = GHReportGenerator(config)
+    assert generator.check_formats(['csv', 'md', 'csv']) == ['csv', 'md']
+
+    result = CliRunner().invoke(app, ['--format', 'xlsx'])
+    assert result.exit_code != 0
+    assert 'xlsx' in result.output
+
+    monkeypatch.setattr(importlib.util, 'find_spec', lambda name: None)
+    with pytest.raises(ImportError):
+        generator.check_formats(['parquet'])
+
+
+def test_generate_parallel(config, tmp_path, monkeypatch):
+    # exercise the worker pool even on single-CPU runners
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+    config.repos = ['org/b', 'org/a', 'org/empty', 'org/c']
+    results = pd.DataFrame(
+        [
+            _row(f'{repo}-{kind}', org_repo=repo, type=kind, state='CLOSED')
+            for repo in ('org/a', 'org/b', 'org/c')
+            for kind in ('pr', 'issue')
+        ]
+    )
+    outputs = []
+    for jobs in (1, 2):
+        config.args.jobs = jobs
+        config.output_dir = str(tmp_path / f'jobs-{jobs}')
+        generator = GHReportGenerator(config)
+        generator.generate(results, ['md'])
+        pool = generator._pool
+        assert (pool is not None) == (jobs > 1)
+        # md and html renders share the same worker pool
+        generator.generate(results, ['html'])
+        assert generator._pool is pool
+        generator.close()
+        path = Path(config.output_dir) / 'report-test-20230701-20230731.md'
+        outputs.append(path.read_text())
+
+    serial, parallel = outputs
+    assert parallel == serial
+    positions = [serial.index(f'## {name}\n') for name in ('b', 'a', 'c')]
+    assert positions == sorted(positions)
+    assert '## empty' not in serial
+
+
+def test_watch_retries_failed_poll(monkeypatch):
+    report = GHReport(
+        ArgsCLI(
+            start_date=START_DATE,
+            end_date=END_DATE,
+            gh_token='token',
+            config_file=str(Path(__file__).parent / '.ghreport.yaml'),
+        )
+    )
+    data = pd.DataFrame([_row('a')])
+    polled: list[str] = []
+    generated: list[pd.DataFrame] = []
+
+    async def connect():
+        pass
+
+    async def get_data():
+        return data
+
+    async def get_updates(since):
+        polled.append(since)
+        if len(polled) == 1:
+            raise ConnectionError('502')
+        return pd.DataFrame([_row('b', updated_at=IN_PERIOD)])
+
+    monkeypatch.setattr(report.reader, 'connect', connect)
+    monkeypatch.setattr(report.reader, 'close', connect)
+    monkeypatch.setattr(report.reader, 'get_data', get_data)
+    monkeypatch.setattr(report.reader, 'get_updates', get_updates)
+    monkeypatch.setattr(report.generator, 'generate', generated.append)
+
+    report.watch(interval=0, max_polls=2)
+
+    # the window of the failed poll is requested again
+    assert polled[0] == polled[1]
+    assert len(generated) == len(polled)
+    assert generated[-1]['id'].tolist() == ['a', 'b']